@@ -1,24 +1,41 @@
-from setuptools import setup, find_packages
+import sys
+from pathlib import Path
+
+from setuptools import setup
+
+
+def _read_readme():
+    """Read the README only for commands that actually publish metadata."""
+    if not {"sdist", "bdist_wheel", "upload"} & set(sys.argv):
+        return ""
+    return Path("README.md").read_text(encoding="utf-8")
+
 
 setup(
     name="YTGrabber",
     version="1.0.0",
-    packages=find_packages(),
+    # Static list: find_packages() walks the whole tree (build/, dist/,
+    # virtualenvs, ...) on every setup.py invocation for a known answer.
+    packages=["src"],
     install_requires=[
         "PySide6>=6.7.0",
         "yt-dlp>=2024.05.18",
         "requests>=2.31.0",
         "qdarktheme>=3.1.0",
     ],
+    extras_require={
+        # Analysis(optimize=...) in the spec needs PyInstaller 6.5+
+        "build": ["pyinstaller>=6.5"],
+    },
     entry_points={
         "console_scripts": [
-            "ytgrabber=src.main:main",
+            "ytgrabber=src._entry:cli",
         ],
     },
     author="Ibrahim Hammad (HaMMaDy)",
     author_email="xhammady@gmail.com",
     description="A powerful YouTube video downloader with modern UI",
-    long_description=open("README.md", encoding="utf-8").read(),
+    long_description=_read_readme(),
     long_description_content_type="text/markdown",
     url="https://github.com/xhammady/YTGrabber",
     classifiers=[
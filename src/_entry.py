@@ -0,0 +1,11 @@
+"""Console entry point stub for YTGrabber.
+
+Deliberately has no top-level imports: the console script resolves this
+module before the user sees anything, so PySide6, yt-dlp, requests and
+qdarktheme must not be paid for until the application actually launches.
+"""
+
+
+def cli():
+    from src.main import main
+    main()